@@ -4,7 +4,8 @@ Recreate the module with these rules:
  - Public exports: ``Router``, ``RoutedClass``, decorator helper ``route``.
 - Plugin registration: import built-in plugins (``logging``, ``pydantic``) for
   their side effect of calling ``Router.register_plugin(<name>, <class>)``.
-  Imports are done lazily via ``import_module`` to avoid cycles.
+  They are plain relative imports placed after the core import, so the core
+  modules are already loaded when the plugins pull in ``Router``.
 
 Constraints
 -----------
@@ -14,16 +15,14 @@ Constraints
   packaging tools.
 """
 
-from importlib import import_module
-
 __version__ = "0.8.4"
 
 from .core import RoutedClass, Router, route
 
-# Import plugins to trigger auto-registration (lazy to avoid cycles)
-for _plugin in ("logging", "pydantic"):
-    import_module(f"{__name__}.plugins.{_plugin}")
-del _plugin
+# Import plugins to trigger auto-registration (after core to avoid cycles)
+from .plugins import logging, pydantic
+
+del logging, pydantic
 
 __all__ = [
     "Router",
@@ -21,11 +21,15 @@ Constructor signature::
   ``name`` to be set; raises ``ValueError`` on name collision.
 - Slots: ``instance``, ``name``, ``prefix`` (string trimmed from function names),
   ``_entries`` (logical name → MethodEntry), ``_handlers`` (name → callable),
-  ``_children`` (name → child router), ``_get_defaults`` (SmartOptions defaults).
+  ``_children`` (name → child router), ``_default_handler`` /
+  ``_use_smartasync_default`` (``get()`` defaults), ``_doc_cache`` (logical
+  name → cleaned docstring used by ``members()``).
 
 - Default options: ``get_default_handler`` and ``get_use_smartasync`` become
-  defaults merged via ``SmartOptions`` in ``get()``; extra ``get_kwargs`` are
-  copied into ``_get_defaults``.
+  defaults for ``get()``. ``get_kwargs`` may carry the same two keys, which
+  win over the dedicated arguments; its other keys are ignored, since
+  ``get()`` reads no other option. Both defaults are resolved once in
+  ``__init__`` into ``_default_handler`` and ``_use_smartasync_default``.
 
 - On init: registers with owner via optional ``_register_router`` hook, then
   auto-discovers entries when ``auto_discover`` is true by calling
@@ -36,12 +40,15 @@ Registration and naming
 ``add_entry(target, *, name=None, metadata=None, replace=False, **options)``
 
 - Accepts a callable or string/iterable of attribute names. Comma-separated
-  strings are split and each processed. Empty/whitespace-only strings are
+  strings are split once (``_split_csv``, memoized and shared with the
+  ``attach_instance`` alias list) and each token registered in a single loop
+  (no recursion). Lists/tuples/sets are walked by ``_add_entry_target`` with the
+  options split only once by ``add_entry``. Empty/whitespace-only strings are
   ignored. ``replace=False`` raises on logical name collision.
 
-- Special markers ``"*"``, ``"_all_"``, ``"__all__"`` trigger marker discovery
-  via ``_register_marked`` (see below). A comma inside such marker string is
-  split and each chunk processed recursively.
+- Special markers ``"*"``, ``"_all_"``, ``"__all__"`` (``_MARKER_SELECTORS``)
+  trigger marker discovery via ``_register_marked`` (see below), also when
+  they appear as a token of a comma-separated string.
 
 - When ``target`` is a string, it is resolved as an attribute of ``owner``; an
   ``AttributeError`` is surfaced with a helpful message.
@@ -50,8 +57,14 @@ Registration and naming
   bound method. ``metadata`` + ``options`` are merged into the MethodEntry
   metadata.
 
-- ``_resolve_name`` strips ``prefix`` from ``func.__name__`` when present; an
-  explicit ``name`` always overrides.
+- Options named ``<plugin>_<key>`` whose prefix is a registered plugin code
+  are split off into ``metadata["plugin_config"]`` by
+  ``_split_plugin_options``. The global plugin registry is looked up once
+  (``_known_plugins``) and then read live, so later registrations are seen.
+
+- ``_resolve_name`` strips ``prefix`` from ``func.__name__`` when present
+  (``prefix`` is read once per call, so reassigning it later is honoured);
+  an explicit ``name`` always overrides.
 
 Marker discovery
 ----------------
@@ -60,34 +73,63 @@ wins), scans ``__dict__`` for plain functions carrying ``TARGET_ATTR_NAME``
 markers.
 Duplicates (by function identity) are skipped. Only markers whose ``name``
 matches this router's ``name`` are used; the name key is removed from the
-payload before consumption. ``_register_marked`` binds each function to owner,
-merges marker data + metadata + extra options, and registers with collision
-behaviour governed by ``replace``.
+payload before consumption. The scan runs once per class: ``_marker_index``
+groups ``(function, payload)`` pairs by router name and writes them into the
+owner class's own ``__dict__`` under ``_MARKER_INDEX_ATTR``
+(``__smartroute_marker_index__``), read through ``vars(cls)`` so subclasses
+never inherit it; the index lives and dies with the class. The scan is frozen
+once the first router of a class discovers markers: ``@route`` methods added
+to the class afterwards are ignored until
+``BaseRouter._invalidate_marker_index(cls)`` drops the index of ``cls`` and
+its subclasses. Cached payloads are frozen (``MappingProxyType``) and each
+consumer receives a fresh ``dict`` copy.
+``_register_marked`` binds each function to owner, merges marker data +
+metadata + extra options, and registers the whole batch at once: names are
+validated up front (collision behaviour governed by ``replace``), so a
+collision registers nothing.
 
 Handler table and wrapping
 --------------------------
 - ``_register_callable`` creates a ``MethodEntry`` (name, bound func, router,
-  empty plugins list, metadata dict) and stores it in ``_entries``; it invokes
-  ``_after_entry_registered`` hook then rebuilds the handler cache.
+  empty plugins list, metadata dict) via ``_build_entry`` and hands it to
+  ``_install_entries``, which stores entries in ``_entries``, drops any cached
+  docstring for their names, invokes the ``_after_entry_registered`` hook for
+  each, then installs only their wrapped handlers in ``_handlers``
+  (registration is O(1) in the number of existing entries).
 
 - ``_rebuild_handlers`` recreates ``_handlers`` by passing each entry through
-  ``_wrap_handler`` (default: passthrough). Subclasses may inject middleware.
+  ``_wrap_handler`` (default: passthrough). When ``_has_middleware()`` is False
+  (by default: ``_wrap_handler`` is not overridden) the bound functions are
+  stored directly and ``_wrap_handler`` is not called at all. Subclasses may
+  inject middleware; they call ``_rebuild_handlers`` only when the wrapping
+  changes for existing entries (e.g. a plugin is attached or inherited).
 
 Lookup and execution
 --------------------
-- ``get(selector, **options)`` merges ``options`` into ``SmartOptions`` using
-  ``_get_defaults``. It resolves ``selector`` via ``_resolve_path``: a dotted
+- ``get(selector, **options)`` reads ``default_handler`` and
+  ``use_smartasync`` from ``options``, falling back to the pre-extracted
+  defaults (call options override init defaults); no options object is
+  allocated. It resolves ``selector`` via ``_resolve_path``: a dotted
   string traverses children (``_children`` lookup) and yields the terminal router plus
   method name; no dot returns ``self`` + selector. Missing children raise
   ``KeyError``. Missing handlers fall back to
   ``default_handler`` (if provided) else raise ``NotImplementedError``.
+- Only the split of a dotted selector is memoized (``_split_selector``, which
+  holds strings only); the ``_children`` walk runs on every lookup, so direct
+  edits of ``_children`` are seen at once and detached routers are never kept
+  alive by a cache.
 
 - When ``use_smartasync`` option is truthy, the returned handler is wrapped via
-  ``smartasync.smartasync`` before returning.
+  ``smartasync.smartasync`` before returning. ``smartasync`` is an optional
+  dependency: it is imported on first use and kept in the module-level
+  ``_smartasync`` (a missing package raises ``ImportError`` at that point).
+  Wrappers are not reused across calls because ``smartasync`` latches the
+  async context it first detects.
 
 - ``__getitem__`` aliases ``get``; ``call`` fetches then invokes the handler
   with given args/kwargs. ``entries`` returns a tuple of registered handler
-  names (built from ``_handlers`` keys).
+  names (built from ``_handlers`` keys and kept in ``_entries_cache`` until the
+  handler table changes).
 
 Children (instance hierarchies only)
 ------------------------------------
@@ -111,7 +153,10 @@ Child discovery helpers
 ``_collect_child_routers(source, override_name=None, seen=None)`` scans only
 attributes/slots on ``source`` for ``BaseRouter`` instances, returning
 ``[(key, router), ...]`` with unique keys (override → attr name → router.name →
-``"child"``). A ``seen`` set guards against cycles.
+``"child"``). A ``seen`` set guards against cycles. Slots declared anywhere
+along the MRO are read with ``getattr``; ``_slot_names`` caches their names per
+class (registry slot excluded). Only names are cached, never the member
+descriptors, so the weak per-class cache does not keep classes alive.
 
 Introspection
 -------------
@@ -119,15 +164,29 @@ Introspection
   filters. Returns dict with ``entries`` and ``routers`` keys only if non-empty.
   Empty routers (no entries, no child routers) return ``{}``.
   Uses helper methods ``_entry_member_info`` and ``_get_plugin_info``.
+  ``inspect.getdoc`` runs once per entry; the result is kept in ``_doc_cache``.
+- Every call builds a fresh tree: no container dict is shared between calls
+  or between a parent's tree and a child's, so callers may edit the result,
+  and ``allow_entry`` verdicts always see the current entry metadata.
+- ``_get_plugin_info`` copies every plugin store slot on each call, so the
+  ``plugin_info`` in a result never aliases the live store. ``BaseRouter``
+  has no plugin store of its own: its class-level ``_plugin_info`` is the
+  shared empty read-only mapping.
 
 Hooks for subclasses
 --------------------
-- ``_wrap_handler``: override to wrap callables (middleware stack).
+- ``_wrap_handler``: override to wrap callables (middleware stack). Overriding
+  it is enough: ``_has_middleware`` then returns True. Override
+  ``_has_middleware`` as well only to skip wrapping when it would be a no-op.
 - ``_after_entry_registered``: invoked after registering a handler.
 - ``_on_attached_to_parent``: invoked when attached via ``attach_instance``.
 - ``_describe_entry_extra``: allow subclasses to extend per-entry description.
 
-Default implementations are no-ops/passthrough.
+Default implementations are no-ops/passthrough. ``__init_subclass__`` records
+whether a subclass overrides ``_after_entry_registered``,
+``_describe_entry_extra`` or ``_wrap_handler`` (``_overrides_after_entry`` /
+``_overrides_describe_entry`` / ``_overrides_wrap_handler``); the per-entry
+call sites skip the no-op hooks entirely when they are not overridden.
 
 Invariants and guarantees
 -------------------------
@@ -135,15 +194,19 @@ Invariants and guarantees
 - Selector traversal never fabricates routers: only attached children are used.
 - Marker discovery is deterministic (reversed MRO, first occurrence wins).
 - Introspection never mutates handler metadata; it reads from ``MethodEntry``.
-- All normalizations preserve user-provided metadata copies (shallow-copied).
+- All normalizations preserve user-provided metadata copies (shallow-copied
+  exactly once per entry; fan-out over lists and comma strings shares the
+  caller's mapping read-only until that copy).
 """
 
 from __future__ import annotations
 
 import inspect
-from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from functools import lru_cache
+from types import FunctionType, MappingProxyType, MethodType
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+from weakref import WeakKeyDictionary
 
-from smartseeds import SmartOptions
 from smartseeds.typeutils import safe_is_instance
 
 from smartroute.plugins._base_plugin import MethodEntry
@@ -152,6 +215,144 @@ __all__ = ["BaseRouter", "TARGET_ATTR_NAME", "ROUTER_REGISTRY_ATTR_NAME"]
 
 TARGET_ATTR_NAME = "__smartroute_targets__"
 ROUTER_REGISTRY_ATTR_NAME = "__smartroute_router_registry__"
+_SKIPPED_SLOTS = frozenset({ROUTER_REGISTRY_ATTR_NAME, "__dict__", "__weakref__"})
+
+# Shared read-only empty mapping (get_* defaults, absent plugin stores)
+_EMPTY_DEFAULTS: Mapping[str, Any] = MappingProxyType({})
+
+_MARKER_SELECTORS = frozenset({"*", "_all_", "__all__"})
+
+
+_plugin_registry: Optional[Mapping[str, Any]] = None
+
+
+def _known_plugins() -> Mapping[str, Any]:
+    """Return the live global plugin registry (imported once; it is mutated in place)."""
+    global _plugin_registry
+    if _plugin_registry is None:
+        try:
+            from smartroute.core.router import _PLUGIN_REGISTRY  # type: ignore
+        except Exception:  # pragma: no cover - import safety
+            return _EMPTY_DEFAULTS
+        _plugin_registry = _PLUGIN_REGISTRY
+    return _plugin_registry
+
+
+@lru_cache(maxsize=256)
+def _split_csv(text: str) -> Tuple[str, ...]:
+    """Split a comma-separated selector into stripped, non-empty tokens (memoized)."""
+    return tuple(chunk for chunk in map(str.strip, text.split(",")) if chunk)
+
+
+@lru_cache(maxsize=256)
+def _split_selector(selector: str) -> Tuple[Tuple[str, ...], str]:
+    """Split a dotted selector into child segments and method name (memoized)."""
+    prefix, _, method_name = selector.rpartition(".")
+    return tuple(prefix.split(".")), method_name
+
+
+def _copy_plugin_slot(slot: Mapping[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Copy one ``{"config", "locals"}`` store slot for ``plugin_info``."""
+    config = slot.get("config")
+    local_state = slot.get("locals")
+    return {
+        "config": config.copy() if config else {},
+        "locals": local_state.copy() if local_state else {},
+    }
+
+
+def _split_plugin_options(
+    source: Mapping[str, Any],
+    known: Mapping[str, Any],
+    core: Dict[str, Any],
+    plugin: Dict[str, Dict[str, Any]],
+) -> None:
+    """Route ``<plugin>_<key>`` options of known plugins into ``plugin``, the rest into ``core``."""
+    for key, value in source.items():
+        idx = key.find("_")
+        # Non-empty plugin name and non-empty plugin key around the first "_"
+        if 0 < idx < len(key) - 1:
+            plugin_name = key[:idx]
+            if plugin_name in known:
+                bucket = plugin.get(plugin_name)
+                if bucket is None:
+                    bucket = plugin[plugin_name] = {}
+                bucket[key[idx + 1 :]] = value
+                continue
+        core[key] = value
+
+
+_smartasync: Optional[Callable[[Callable], Callable]] = None
+
+
+def _load_smartasync() -> Callable[[Callable], Callable]:
+    global _smartasync
+    from smartasync import smartasync  # type: ignore
+
+    wrap: Callable[[Callable], Callable] = smartasync
+    _smartasync = wrap
+    return wrap
+
+
+_MarkerIndex = Dict[Optional[str], Tuple[Tuple[Callable, Mapping[str, Any]], ...]]
+# Stored in the class's own __dict__: the index holds the functions, whose
+# ``__class__`` cells (zero-arg super()) point back at the class, so a
+# module-level weak cache would pin the class forever.
+_MARKER_INDEX_ATTR = "__smartroute_marker_index__"
+
+
+_MISSING = object()
+
+# Only slot names are cached: member descriptors hold ``__objclass__`` strongly,
+# which would keep the weak key (the class) alive forever.
+_SLOT_INDEX: "WeakKeyDictionary[type, Tuple[str, ...]]" = WeakKeyDictionary()
+
+
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """Return names of slots declared along ``cls.__mro__`` (cached per class)."""
+    names = _SLOT_INDEX.get(cls)
+    if names is not None:
+        return names
+    found: List[str] = []
+    for base in cls.__mro__:
+        base_dict = vars(base)
+        slots = base_dict.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for slot in slots:
+            if slot in found or slot in _SKIPPED_SLOTS:
+                continue
+            if slot not in base_dict:
+                continue  # name-mangled private slot
+            found.append(slot)
+    names = _SLOT_INDEX[cls] = tuple(found)
+    return names
+
+
+def _marker_index(cls: type) -> _MarkerIndex:
+    """Return marked functions of ``cls`` grouped by router name (cached per class)."""
+    index: Optional[_MarkerIndex] = vars(cls).get(_MARKER_INDEX_ATTR)
+    if index is not None:
+        return index
+    # Functions hash by identity: dict.fromkeys dedups while keeping first occurrence order
+    functions = dict.fromkeys(
+        value
+        for base in reversed(cls.__mro__)
+        for value in vars(base).values()
+        if type(value) is FunctionType
+    )
+    grouped: Dict[Optional[str], List[Tuple[Callable, Mapping[str, Any]]]] = {}
+    for func in functions:
+        for marker in getattr(func, TARGET_ATTR_NAME, None) or ():
+            payload = dict(marker)
+            router_name = payload.pop("name", None)
+            grouped.setdefault(router_name, []).append((func, MappingProxyType(payload)))
+    index = {router_name: tuple(items) for router_name, items in grouped.items()}
+    try:
+        setattr(cls, _MARKER_INDEX_ATTR, index)
+    except (AttributeError, TypeError):  # pragma: no cover - immutable (builtin) owner types
+        pass
+    return index
 
 
 class BaseRouter:
@@ -170,11 +371,32 @@ class BaseRouter:
         "prefix",
         "_entries",
         "_handlers",
+        "_entries_cache",
         "_children",
-        "_get_defaults",
+        "_default_handler",
+        "_use_smartasync_default",
         "_is_branch",
+        "_doc_cache",
     )
 
+    # Read-only class default; Router keeps a real store in its own slot
+    _plugin_info: Mapping[str, Any] = _EMPTY_DEFAULTS
+
+    # Set per subclass by __init_subclass__: False while the hook is the base no-op
+    _overrides_after_entry: bool = False
+    _overrides_describe_entry: bool = False
+    _overrides_wrap_handler: bool = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._overrides_after_entry = (
+            cls._after_entry_registered is not BaseRouter._after_entry_registered
+        )
+        cls._overrides_describe_entry = (
+            cls._describe_entry_extra is not BaseRouter._describe_entry_extra
+        )
+        cls._overrides_wrap_handler = cls._wrap_handler is not BaseRouter._wrap_handler
+
     def __init__(
         self,
         owner: Any,
@@ -197,13 +419,14 @@ class BaseRouter:
         self._is_branch = bool(branch)
         self._entries: Dict[str, MethodEntry] = {}
         self._handlers: Dict[str, Callable] = {}
+        self._entries_cache: Optional[Tuple[str, ...]] = None
         self._children: Dict[str, BaseRouter] = {}
-        defaults: Dict[str, Any] = dict(get_kwargs or {})
-        if get_default_handler is not None:
-            defaults.setdefault("default_handler", get_default_handler)
-        if get_use_smartasync is not None:
-            defaults.setdefault("use_smartasync", get_use_smartasync)
-        self._get_defaults: Dict[str, Any] = defaults
+        self._doc_cache: Dict[str, str] = {}
+        get_defaults: Mapping[str, Any] = get_kwargs or _EMPTY_DEFAULTS
+        self._default_handler: Optional[Callable] = get_defaults.get(
+            "default_handler", get_default_handler
+        )
+        self._use_smartasync_default = bool(get_defaults.get("use_smartasync", get_use_smartasync))
         self._register_with_owner()
         if self._is_branch and auto_discover:
             raise ValueError("Branch routers cannot auto-discover handlers")
@@ -220,13 +443,6 @@ class BaseRouter:
             parent_router._children[alias] = self
             self._on_attached_to_parent(parent_router)
 
-    def _is_known_plugin(self, prefix: str) -> bool:
-        try:
-            from smartroute.core.router import Router  # type: ignore
-        except Exception:  # pragma: no cover - import safety
-            return False
-        return prefix in Router.available_plugins()
-
     # ------------------------------------------------------------------
     # Registration helpers
     # ------------------------------------------------------------------
@@ -263,74 +479,101 @@ class BaseRouter:
         """
         if self._is_branch:
             raise ValueError("Branch routers cannot register handlers")
-        entry_name = name
         # Split plugin-scoped options (<plugin>_<key>) from core options
         plugin_options: Dict[str, Dict[str, Any]] = {}
         core_options: Dict[str, Any] = {}
-        for key, value in options.items():
-            if "_" in key:
-                plugin_name, plug_key = key.split("_", 1)
-                if plugin_name and plug_key and self._is_known_plugin(plugin_name):
-                    plugin_options.setdefault(plugin_name, {})[plug_key] = value
-                    continue
-            core_options[key] = value
+        if options:
+            _split_plugin_options(options, _known_plugins(), core_options, plugin_options)
+        self._add_entry_target(
+            target,
+            name=name,
+            metadata=metadata,
+            replace=replace,
+            core_options=core_options,
+            plugin_options=plugin_options,
+        )
+        return self
 
+    def _add_entry_target(
+        self,
+        target: Any,
+        *,
+        name: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+        replace: bool,
+        core_options: Dict[str, Any],
+        plugin_options: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """Register ``target`` with options already split by ``add_entry``."""
         if isinstance(target, (list, tuple, set)):
-            for entry in target:
-                self.add_entry(
-                    entry,
-                    name=entry_name,
-                    metadata=dict(metadata or {}),
+            for item in target:
+                self._add_entry_target(
+                    item,
+                    name=name,
+                    metadata=metadata,
                     replace=replace,
-                    **core_options,
+                    core_options=core_options,
+                    plugin_options=plugin_options,
                 )
-            return self
+            return
 
         if isinstance(target, str):
-            target = target.strip()
-            if not target:
-                return self
-            if target in {"*", "_all_", "__all__"}:
-                self._register_marked(
-                    name=entry_name,
+            for token in _split_csv(target):
+                if token in _MARKER_SELECTORS:
+                    self._register_marked(
+                        name=name,
+                        metadata=metadata,
+                        replace=replace,
+                        extra=core_options,
+                        plugin_options=plugin_options,
+                    )
+                    continue
+                self._register_with_options(
+                    getattr(self.instance, token),
+                    name=name,
                     metadata=metadata,
                     replace=replace,
-                    extra=core_options,
+                    core_options=core_options,
                     plugin_options=plugin_options,
                 )
-                return self
-            if "," in target:
-                for chunk in target.split(","):
-                    chunk = chunk.strip()
-                    if chunk:
-                        self.add_entry(
-                            chunk,
-                            name=entry_name,
-                            metadata=dict(metadata or {}),
-                            replace=replace,
-                            **core_options,
-                        )
-                return self
-            bound = getattr(self.instance, target)
-        elif callable(target):
-            bound = (
-                target
-                if inspect.ismethod(target)
-                else target.__get__(self.instance, type(self.instance))
-            )
-        else:
+            return
+
+        if not callable(target):
             raise TypeError(f"Unsupported add_entry target: {target!r}")
+        bound = (
+            target
+            if isinstance(target, MethodType)
+            else target.__get__(self.instance, type(self.instance))
+        )
+        self._register_with_options(
+            bound,
+            name=name,
+            metadata=metadata,
+            replace=replace,
+            core_options=core_options,
+            plugin_options=plugin_options,
+        )
 
+    def _register_with_options(
+        self,
+        bound: Callable,
+        *,
+        name: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+        replace: bool,
+        core_options: Dict[str, Any],
+        plugin_options: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """Register one callable with its own copies of metadata and plugin options."""
         entry_meta = dict(metadata or {})
         entry_meta.update(core_options)
         self._register_callable(
             bound,
-            name=entry_name,
+            name=name,
             metadata=entry_meta,
             replace=replace,
-            plugin_options=plugin_options,
+            plugin_options={pname: dict(pdata) for pname, pdata in plugin_options.items()},
         )
-        return self
 
     def _register_callable(
         self,
@@ -341,22 +584,52 @@ class BaseRouter:
         replace: bool = False,
         plugin_options: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> None:
-        logical_name = self._resolve_name(bound.__name__, name_override=name)
-        if logical_name in self._entries and not replace:
-            raise ValueError(f"Handler name collision: {logical_name}")
+        # ``metadata`` is owned by the new entry: callers pass a fresh dict.
+        entry = self._build_entry(
+            bound,
+            name=name,
+            metadata=metadata if metadata is not None else {},
+            plugin_options=plugin_options,
+        )
+        if entry.name in self._entries and not replace:
+            raise ValueError(f"Handler name collision: {entry.name}")
+        self._install_entries([entry])
+
+    def _build_entry(
+        self,
+        bound: Callable,
+        *,
+        name: Optional[str],
+        metadata: Dict[str, Any],
+        plugin_options: Optional[Dict[str, Dict[str, Any]]],
+    ) -> MethodEntry:
         entry = MethodEntry(
-            name=logical_name,
+            name=self._resolve_name(bound.__name__, name_override=name),
             func=bound,
             router=self,
             plugins=[],
-            metadata=dict(metadata or {}),
+            metadata=metadata,
         )
         # Attach plugin-scoped config to metadata for later consumption by plugin-enabled routers.
         if plugin_options:
             entry.metadata["plugin_config"] = plugin_options
-        self._entries[logical_name] = entry
-        self._after_entry_registered(entry)
-        self._rebuild_handlers()
+        return entry
+
+    def _install_entries(self, entries: List[MethodEntry]) -> None:
+        for entry in entries:
+            self._entries[entry.name] = entry
+            self._doc_cache.pop(entry.name, None)
+        if self._overrides_after_entry:
+            for entry in entries:
+                self._after_entry_registered(entry)
+        handlers = self._handlers
+        if self._has_middleware():
+            for entry in entries:
+                handlers[entry.name] = self._wrap_handler(entry, entry.func)
+        else:
+            for entry in entries:
+                handlers[entry.name] = entry.func
+        self._entries_cache = None
 
     def _register_marked(
         self,
@@ -367,64 +640,56 @@ class BaseRouter:
         extra: Dict[str, Any],
         plugin_options: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> None:
+        instance = self.instance
+        owner_type = type(instance)
+        batch: List[MethodEntry] = []
+        batch_names: set[str] = set()
+        known = _known_plugins()
         for func, marker in self._iter_marked_methods():
             entry_override = marker.pop("entry_name", None)
             entry_name = name if name is not None else entry_override
-            entry_meta = dict(metadata or {})
-            entry_meta.update(marker)
-            entry_meta.update(extra)
-            # Split plugin-scoped options from marker payload as well
+            # Merge metadata < marker < extra, splitting plugin-scoped options on the way
             marker_plugin_opts: Dict[str, Dict[str, Any]] = {}
-            core_marker: Dict[str, Any] = {}
-            for key, value in entry_meta.items():
-                if "_" in key:
-                    plugin_name, plug_key = key.split("_", 1)
-                    if plugin_name and plug_key and self._is_known_plugin(plugin_name):
-                        marker_plugin_opts.setdefault(plugin_name, {})[plug_key] = value
-                        continue
-                core_marker[key] = value
-            entry_meta = core_marker
-            merged_plugin_opts: Dict[str, Dict[str, Any]] = {}
-            if plugin_options:
-                merged_plugin_opts.update(plugin_options)
+            entry_meta: Dict[str, Any] = {}
+            for source in (metadata or {}, marker, extra):
+                _split_plugin_options(source, known, entry_meta, marker_plugin_opts)
+            merged_plugin_opts: Dict[str, Dict[str, Any]] = {
+                pname: dict(pdata) for pname, pdata in (plugin_options or {}).items()
+            }
             for pname, pdata in marker_plugin_opts.items():
                 merged_plugin_opts.setdefault(pname, {}).update(pdata)
-            bound = func.__get__(self.instance, type(self.instance))
-            self._register_callable(
-                bound,
+            entry = self._build_entry(
+                func.__get__(instance, owner_type),
                 name=entry_name,
                 metadata=entry_meta,
-                replace=replace,
                 plugin_options=merged_plugin_opts or None,
             )
+            if not replace and (entry.name in self._entries or entry.name in batch_names):
+                raise ValueError(f"Handler name collision: {entry.name}")
+            batch_names.add(entry.name)
+            batch.append(entry)
+        if batch:
+            self._install_entries(batch)
 
     def _iter_marked_methods(self) -> Iterator[Tuple[Callable, Dict[str, Any]]]:
-        cls = type(self.instance)
-        seen: set[int] = set()
-        for base in reversed(cls.__mro__):
-            base_dict = vars(base)
-            for attr_name, value in base_dict.items():
-                if not inspect.isfunction(value):
-                    continue
-                func_id = id(value)
-                if func_id in seen:
-                    continue
-                seen.add(func_id)
-                markers = getattr(value, TARGET_ATTR_NAME, None)
-                if not markers:
-                    continue
-                for marker in markers:
-                    if marker.get("name") != self.name:
-                        continue
-                    payload = dict(marker)
-                    payload.pop("name", None)
-                    yield value, payload
+        for func, payload in _marker_index(type(self.instance)).get(self.name, ()):
+            yield func, dict(payload)
+
+    @staticmethod
+    def _invalidate_marker_index(cls: type) -> None:
+        """Drop the cached marker scan of ``cls`` and its subclasses."""
+        if _MARKER_INDEX_ATTR in vars(cls):
+            delattr(cls, _MARKER_INDEX_ATTR)
+        subclasses: List[type] = cls.__subclasses__()
+        for subclass in subclasses:
+            BaseRouter._invalidate_marker_index(subclass)
 
     def _resolve_name(self, func_name: str, *, name_override: Optional[str]) -> str:
         if name_override:
             return name_override
-        if self.prefix and func_name.startswith(self.prefix):
-            return func_name[len(self.prefix) :]
+        prefix = self.prefix
+        if prefix and func_name.startswith(prefix):
+            return func_name[len(prefix) :]
         return func_name
 
     def _wrap_handler(
@@ -432,15 +697,24 @@ class BaseRouter:
     ) -> Callable:  # pragma: no cover - overridden by plugin routers
         return call_next
 
+    def _has_middleware(self) -> bool:
+        """Return True when ``_wrap_handler`` may return something other than ``call_next``."""
+        return self._overrides_wrap_handler
+
     # ------------------------------------------------------------------
     # Handler execution
     # ------------------------------------------------------------------
     def _rebuild_handlers(self) -> None:
+        if not self._has_middleware():
+            self._handlers = {name: entry.func for name, entry in self._entries.items()}
+            self._entries_cache = None
+            return
         handlers: Dict[str, Callable] = {}
         for logical_name, entry in self._entries.items():
             wrapped = self._wrap_handler(entry, entry.func)
             handlers[logical_name] = wrapped
         self._handlers = handlers
+        self._entries_cache = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -452,9 +726,12 @@ class BaseRouter:
         ``default_handler`` if provided, otherwise raises NotImplementedError.
         When ``use_smartasync`` is true, the handler is wrapped accordingly.
         """
-        opts = SmartOptions(options, defaults=self._get_defaults)
-        default = getattr(opts, "default_handler", None)
-        use_smartasync = getattr(opts, "use_smartasync", False)
+        if options:
+            default = options.get("default_handler", self._default_handler)
+            use_smartasync = options.get("use_smartasync", self._use_smartasync_default)
+        else:
+            default = self._default_handler
+            use_smartasync = self._use_smartasync_default
 
         node, method_name = self._resolve_path(selector)
         handler = node._handlers.get(method_name)
@@ -466,9 +743,7 @@ class BaseRouter:
             )
 
         if use_smartasync:
-            from smartasync import smartasync  # type: ignore
-
-            handler = smartasync(handler)
+            handler = (_smartasync or _load_smartasync())(handler)
 
         return handler
 
@@ -481,7 +756,10 @@ class BaseRouter:
 
     def entries(self) -> Tuple[str, ...]:
         """Return a tuple of logical handler names registered on this router."""
-        return tuple(self._handlers.keys())
+        names = self._entries_cache
+        if names is None:
+            names = self._entries_cache = tuple(self._handlers)
+        return names
 
     # ------------------------------------------------------------------
     # Children management (via attach_instance/detach_instance)
@@ -494,10 +772,17 @@ class BaseRouter:
         if existing_parent is not None and existing_parent is not self.instance:
             raise ValueError("attach_instance() rejected: child already bound to another parent")
 
-        # Require the parent to already reference the child via an attribute.
-        has_attr_reference = any(
-            value is routed_child for _, value in self._iter_instance_attributes(self.instance)
+        # Require the parent to already reference the child via an attribute
+        # (plain instance attributes first, declared slots only as a fallback).
+        instance = self.instance
+        inst_dict = getattr(instance, "__dict__", None)
+        has_attr_reference = inst_dict is not None and any(
+            value is routed_child for value in inst_dict.values()
         )
+        if not has_attr_reference:
+            has_attr_reference = any(
+                value is routed_child for _, value in self._iter_slot_attributes(instance)
+            )
         if not has_attr_reference:
             raise ValueError("attach_instance() requires the child to be stored on the parent")
 
@@ -508,7 +793,7 @@ class BaseRouter:
             )  # pragma: no cover
 
         mapping: Dict[str, str] = {}
-        tokens = [chunk.strip() for chunk in (name.split(",") if name else []) if chunk.strip()]
+        tokens = _split_csv(name) if name else ()
         parent_registry = getattr(self.instance, ROUTER_REGISTRY_ATTR_NAME, {}) or {}
         parent_has_multiple = len(parent_registry) > 1
 
@@ -564,7 +849,8 @@ class BaseRouter:
             router._on_attached_to_parent(self)
             attached = router
 
-        if getattr(routed_child, "_routed_parent", None) is not self.instance:
+        # ``existing_parent`` is either None or already this instance (checked above)
+        if existing_parent is None:
             object.__setattr__(routed_child, "_routed_parent", self.instance)
         assert attached is not None
         return attached
@@ -596,24 +882,16 @@ class BaseRouter:
             return []  # pragma: no cover - defensive cycle guard
         seen.add(obj_id)
 
-        router_items: List[Tuple[str, BaseRouter]] = []
-        for attr_name, value in self._iter_instance_attributes(source):
-            if value is None or value is source:
-                continue
-            if isinstance(value, BaseRouter):
-                router_items.append((attr_name, value))
-
-        if not router_items:
-            return []
-
         keyed: List[Tuple[str, BaseRouter]] = []
         seen_keys: set[str] = set()
-        for attr_name, router in router_items:
-            key = override_name or attr_name or router.name or "child"
+        for attr_name, value in self._iter_instance_attributes(source):
+            if not isinstance(value, BaseRouter) or value is source:
+                continue
+            key = override_name or attr_name or value.name or "child"
             if key in seen_keys:
                 continue  # pragma: no cover - duplicate key guard
             seen_keys.add(key)
-            keyed.append((key, router))
+            keyed.append((key, value))
         return keyed
 
     @staticmethod
@@ -624,14 +902,14 @@ class BaseRouter:
                 if key == ROUTER_REGISTRY_ATTR_NAME:
                     continue
                 yield key, value
-        slots = getattr(type(obj), "__slots__", ())
-        if isinstance(slots, str):
-            slots = (slots,)
-        for slot in slots:
-            if slot == ROUTER_REGISTRY_ATTR_NAME:
-                continue
-            if hasattr(obj, slot):
-                yield slot, getattr(obj, slot)
+        yield from BaseRouter._iter_slot_attributes(obj)
+
+    @staticmethod
+    def _iter_slot_attributes(obj: Any) -> Iterator[Tuple[str, Any]]:
+        for slot in _slot_names(type(obj)):
+            value = getattr(obj, slot, _MISSING)
+            if value is not _MISSING:  # skip slots declared but never assigned
+                yield slot, value
 
     # ------------------------------------------------------------------
     # Routing helpers
@@ -639,11 +917,11 @@ class BaseRouter:
     def _resolve_path(self, selector: str) -> Tuple["BaseRouter", str]:
         if "." not in selector:
             return self, selector
+        segments, method_name = _split_selector(selector)
         node: BaseRouter = self
-        parts = selector.split(".")
-        for segment in parts[:-1]:
+        for segment in segments:
             node = node._children[segment]
-        return node, parts[-1]
+        return node, method_name
 
     # ------------------------------------------------------------------
     # Introspection helpers
@@ -652,17 +930,20 @@ class BaseRouter:
         """Return a tree of routers/entries/metadata respecting filters."""
         filter_args = self._prepare_filter_args(**kwargs)
 
+        allow = self._allow_entry
+        describe = self._entry_member_info
         entries = {
-            entry.name: self._entry_member_info(entry)
+            entry.name: describe(entry)
             for entry in self._entries.values()
-            if self._allow_entry(entry, **filter_args)
+            if allow(entry, **filter_args)
         }
 
+        # Empty child routers are left out
         routers = {
-            child_name: child.members(**kwargs) for child_name, child in self._children.items()
+            child_name: child_tree
+            for child_name, child in self._children.items()
+            if (child_tree := child.members(**kwargs))
         }
-        # Remove empty routers
-        routers = {k: v for k, v in routers.items() if v}
 
         # If nothing, return empty dict
         if not entries and not routers:
@@ -683,29 +964,27 @@ class BaseRouter:
 
     def _entry_member_info(self, entry: MethodEntry) -> Dict[str, Any]:
         """Build info dict for a single entry."""
+        doc = self._doc_cache.get(entry.name)
+        if doc is None:
+            doc = inspect.getdoc(entry.func) or entry.func.__doc__ or ""
+            self._doc_cache[entry.name] = doc
         info: Dict[str, Any] = {
             "name": entry.name,
             "callable": entry.func,
             "metadata": entry.metadata,
-            "doc": inspect.getdoc(entry.func) or entry.func.__doc__ or "",
+            "doc": doc,
         }
-        extra = self._describe_entry_extra(entry, info)
-        if extra:
-            info.update(extra)
+        if self._overrides_describe_entry:
+            extra = self._describe_entry_extra(entry, info)
+            if extra:
+                info.update(extra)
         return info
 
     def _get_plugin_info(self) -> Dict[str, Any]:
         """Build plugin_info dict from _plugin_info store."""
-        info_source = getattr(self, "_plugin_info", {}) or {}
         return {
-            pname: {
-                key: {
-                    "config": dict(slot.get("config", {})),
-                    "locals": dict(slot.get("locals", {})),
-                }
-                for key, slot in pdata.items()
-            }
-            for pname, pdata in info_source.items()
+            pname: {key: _copy_plugin_slot(slot) for key, slot in pdata.items()}
+            for pname, pdata in self._plugin_info.items()
         }
 
     # ------------------------------------------------------------------
@@ -734,7 +1013,13 @@ class BaseRouter:
 
     def _prepare_filter_args(self, **raw_filters: Any) -> Dict[str, Any]:
         """Return normalized filters understood by subclasses (default: passthrough)."""
-        return {key: value for key, value in raw_filters.items() if value not in (None, False)}
+        if not raw_filters:
+            return raw_filters
+        return {
+            key: value
+            for key, value in raw_filters.items()
+            if value is not None and value is not False
+        }
 
     def _allow_entry(self, entry: MethodEntry, **filters: Any) -> bool:
         """Hook used by subclasses to decide if an entry is exposed."""
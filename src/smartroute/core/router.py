@@ -46,6 +46,9 @@ plugin, it calls ``plugin.wrap_handler(self, entry, wrapped)`` to produce a
 callable, then wraps it with a guard that skips execution when
 ``is_plugin_enabled`` is False. ``functools.wraps`` preserves metadata of the
 next callable. The final callable is stored in ``_handlers`` by ``BaseRouter``.
+``_has_middleware()`` is True while plugins are attached or when a subclass
+overrides ``_wrap_handler``; otherwise bound functions are stored in
+``_handlers`` unwrapped.
 
 Entry/plugin application
 ------------------------
@@ -80,6 +83,7 @@ Description hooks
 - ``_describe_entry_extra`` asks plugins to contribute extra fields for
   ``members()`` output. Plugins implement ``entry_metadata(router, entry)``
   which returns a dict stored in ``plugins[plugin_name]["metadata"]``.
+  Routers without plugins return ``{}`` before any per-entry work.
 
 Data shapes
 -----------
@@ -105,7 +109,8 @@ from __future__ import annotations
 import copy
 from dataclasses import dataclass
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Type
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Type
 
 from smartroute.core.base_router import BaseRouter
 from smartroute.plugins._base_plugin import BasePlugin, MethodEntry
@@ -114,6 +119,10 @@ __all__ = ["Router"]
 
 _PLUGIN_REGISTRY: Dict[str, Type[BasePlugin]] = {}
 
+# Read-only defaults for store lookups on the per-call path (no allocation).
+_MISSING = object()
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 
 @dataclass
 class _PluginSpec:
@@ -232,6 +241,17 @@ class Router(BaseRouter):
             bucket["_all_"] = {"config": {}, "locals": {}}
         return bucket
 
+    @staticmethod
+    def _entry_locals(bucket: Dict[str, Any], method_name: str) -> Dict[str, Any]:
+        """Return the writable ``locals`` of a handler slot, creating it only when missing."""
+        entry = bucket.get(method_name)
+        if entry is None:
+            entry = bucket[method_name] = {"config": {}, "locals": {}}
+        entry_locals = entry.get("locals")
+        if entry_locals is None:
+            entry_locals = entry["locals"] = {}
+        return entry_locals
+
     # ------------------------------------------------------------------
     # Runtime helpers (state stored on plugin_info)
     # ------------------------------------------------------------------
@@ -241,8 +261,7 @@ class Router(BaseRouter):
             raise AttributeError(
                 f"No plugin named '{plugin_name}' attached to router '{self.name}'"
             )
-        entry = bucket.setdefault(method_name, {"config": {}, "locals": {}})
-        entry.setdefault("locals", {})["enabled"] = bool(enabled)
+        self._entry_locals(bucket, method_name)["enabled"] = bool(enabled)
 
     def is_plugin_enabled(self, method_name: str, plugin_name: str) -> bool:
         bucket = self._get_plugin_bucket(plugin_name, create=False)
@@ -250,10 +269,11 @@ class Router(BaseRouter):
             raise AttributeError(
                 f"No plugin named '{plugin_name}' attached to router '{self.name}'"
             )
-        entry_locals = bucket.get(method_name, {}).get("locals", {})
-        if "enabled" in entry_locals:
-            return bool(entry_locals["enabled"])
-        base_locals = bucket.get("_all_", {}).get("locals", {})
+        entry_locals = bucket.get(method_name, _EMPTY).get("locals", _EMPTY)
+        enabled = entry_locals.get("enabled", _MISSING)
+        if enabled is not _MISSING:
+            return bool(enabled)
+        base_locals = bucket.get("_all_", _EMPTY).get("locals", _EMPTY)
         return bool(base_locals.get("enabled", True))
 
     def set_runtime_data(self, method_name: str, plugin_name: str, key: str, value: Any) -> None:
@@ -262,8 +282,7 @@ class Router(BaseRouter):
             raise AttributeError(
                 f"No plugin named '{plugin_name}' attached to router '{self.name}'"
             )
-        entry = bucket.setdefault(method_name, {"config": {}, "locals": {}})
-        entry.setdefault("locals", {})[key] = value
+        self._entry_locals(bucket, method_name)[key] = value
 
     def get_runtime_data(
         self, method_name: str, plugin_name: str, key: str, default: Any = None
@@ -273,12 +292,15 @@ class Router(BaseRouter):
             raise AttributeError(
                 f"No plugin named '{plugin_name}' attached to router '{self.name}'"
             )
-        entry_locals = bucket.get(method_name, {}).get("locals", {})
+        entry_locals = bucket.get(method_name, _EMPTY).get("locals", _EMPTY)
         return entry_locals.get(key, default)
 
     # ------------------------------------------------------------------
     # Overrides/hooks
     # ------------------------------------------------------------------
+    def _has_middleware(self) -> bool:  # type: ignore[override]
+        return bool(self._plugins) or type(self)._wrap_handler is not Router._wrap_handler
+
     def _wrap_handler(self, entry: MethodEntry, call_next: Callable) -> Callable:  # type: ignore[override]
         wrapped = call_next
         for plugin in reversed(self._plugins):
@@ -344,10 +366,12 @@ class Router(BaseRouter):
         plugin_options = entry.metadata.get("plugin_config", {})
         if plugin_options:
             for pname, cfg in plugin_options.items():
-                bucket = self._plugin_info.setdefault(
-                    pname, {"_all_": {"config": {}, "locals": {}}}
-                )
-                entry_bucket = bucket.setdefault(entry.name, {"config": {}, "locals": {}})
+                bucket = self._plugin_info.get(pname)
+                if bucket is None:
+                    bucket = self._plugin_info[pname] = {"_all_": {"config": {}, "locals": {}}}
+                entry_bucket = bucket.get(entry.name)
+                if entry_bucket is None:
+                    entry_bucket = bucket[entry.name] = {"config": {}, "locals": {}}
                 entry_bucket["config"].update(cfg)
         for plugin in self._plugins:
             if plugin.name not in entry.plugins:
@@ -367,6 +391,8 @@ class Router(BaseRouter):
         self, entry: MethodEntry, base_description: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Gather plugin config and metadata for a handler."""
+        if not self._plugins:
+            return {}
         plugins_info: Dict[str, Dict[str, Any]] = {}
         for plugin in self._plugins:
             plugin_data: Dict[str, Any] = {}
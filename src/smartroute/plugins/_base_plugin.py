@@ -88,13 +88,16 @@ Design constraints
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from functools import wraps
-from typing import Any, Callable, Dict, List, Optional
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 from pydantic import validate_call
 
 __all__ = ["BasePlugin", "MethodEntry"]
 
+_EMPTY_CONFIG: Mapping[str, Any] = MappingProxyType({})
+
 
 @dataclass
 class MethodEntry:
@@ -107,6 +110,27 @@ class MethodEntry:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@lru_cache(maxsize=256)
+def _parse_flag_pairs(flags: str) -> Tuple[Tuple[str, bool], ...]:
+    """Parse a flags string (e.g. ``"enabled,before:off"``) into name/bool pairs.
+
+    Flag strings are usually static literals repeated across plugin instances,
+    so results are memoized; pairs are returned as a tuple to keep them
+    immutable and hashable.
+    """
+    pairs: List[Tuple[str, bool]] = []
+    for chunk in flags.split(","):
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        name, sep, value = chunk.partition(":")
+        if sep:
+            pairs.append((name.strip(), value.strip().lower() != "off"))
+        else:
+            pairs.append((chunk, True))
+    return tuple(pairs)
+
+
 def _wrap_configure(original_configure: Callable) -> Callable:
     """Wrap a plugin's configure() method to handle flags, _target, validation, and storage."""
     validated = validate_call(original_configure)
@@ -173,27 +197,53 @@ class BasePlugin:
         if not config:
             return
         store = self._get_store()
-        plugin_bucket = store.setdefault(self.name, {})
-        bucket = plugin_bucket.setdefault(target, {"config": {}, "locals": {}})
+        plugin_bucket: Optional[Dict[str, Any]] = store.get(self.name)
+        if plugin_bucket is None:
+            plugin_bucket = store[self.name] = {}
+        bucket = plugin_bucket.get(target)
+        if bucket is None:
+            bucket = plugin_bucket[target] = {"config": {}, "locals": {}}
         bucket["config"].update(config)
         # Notify children about config change
         self._notify_children(config)
 
     def configuration(self, method_name: Optional[str] = None) -> Dict[str, Any]:
         """Read merged configuration (base + optional per-handler override)."""
-        store = self._get_store()
-        plugin_bucket = store.get(self.name)
-        if not plugin_bucket:
-            return {}
-        base_bucket = plugin_bucket.get("_all_", {})
-        base_config = self._resolve_config(base_bucket.get("config", {}))
+        base_config, entry_config = self._config_layers(method_name)
         merged = dict(base_config)
-        if method_name:
-            entry_bucket = plugin_bucket.get(method_name, {})
-            entry_config = self._resolve_config(entry_bucket.get("config", {}))
+        if entry_config:
             merged.update(entry_config)
         return merged
 
+    def _config_view(self, method_name: Optional[str] = None) -> Mapping[str, Any]:
+        """Read merged configuration without copying when no override exists.
+
+        Used on per-call paths. The result may be the live store dict, so
+        callers must treat it as read-only; use ``configuration()`` for a copy.
+        """
+        base_config, entry_config = self._config_layers(method_name)
+        if not entry_config:
+            return base_config
+        merged = dict(base_config)
+        merged.update(entry_config)
+        return merged
+
+    def _config_layers(
+        self, method_name: Optional[str]
+    ) -> Tuple[Mapping[str, Any], Optional[Mapping[str, Any]]]:
+        """Return ``(base_config, entry_config)`` from the router's store."""
+        plugin_bucket = self._get_store().get(self.name)
+        if not plugin_bucket:
+            return _EMPTY_CONFIG, None
+        base_bucket = plugin_bucket.get("_all_", {})
+        base_config = self._resolve_config(base_bucket.get("config", {}))
+        if not method_name:
+            return base_config, None
+        entry_bucket = plugin_bucket.get(method_name)
+        if not entry_bucket:
+            return base_config, None
+        return base_config, self._resolve_config(entry_bucket.get("config", {}))
+
     def _resolve_config(self, config: Any) -> Dict[str, Any]:
         """Resolve config value - if callable, call it to get the dict."""
         if callable(config):
@@ -203,17 +253,7 @@ class BasePlugin:
         return config
 
     def _parse_flags(self, flags: str) -> Dict[str, bool]:
-        mapping: Dict[str, bool] = {}
-        for chunk in flags.split(","):
-            chunk = chunk.strip()
-            if not chunk:
-                continue
-            if ":" in chunk:
-                name, value = chunk.split(":", 1)
-                mapping[name.strip()] = value.strip().lower() != "off"
-            else:
-                mapping[chunk] = True
-        return mapping
+        return dict(_parse_flag_pairs(flags))
 
     def _get_store(self) -> Dict[str, Any]:
         return getattr(self._router, "_plugin_info")
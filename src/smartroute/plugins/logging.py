@@ -114,7 +114,7 @@ class LoggingPlugin(BasePlugin):
 
     def _effective_config(self, entry_name: str) -> dict:
         defaults = {"enabled": True, "before": True, "after": True, "log": True, "print": False}
-        cfg = defaults | self.configuration(entry_name)
+        cfg = {**defaults, **self._config_view(entry_name)}
         flags = cfg.pop("flags", None)
         if isinstance(flags, str):
             cfg.update(self._parse_flags(flags))
@@ -26,11 +26,20 @@ Behaviour and data
     * resolves type hints via ``get_type_hints(func)``; exceptions skip model.
     * removes ``return`` hint if present.
     * builds a fields dict from function signature:
-        - annotated parameters missing from signature get required ellipsis.
+        - a hint naming a parameter missing from the signature raises
+          ``ValueError``.
         - parameters with default use that default; otherwise required.
     * creates a model ``<func.__name__>_Model`` via ``create_model``.
     * stores metadata in ``entry.metadata["pydantic"]``:
       ``{"model": model, "hints": hints, "signature": sig}``.
+    * for bound methods the ``(model, hints, signature)`` triple (or "no
+      model") is cached per underlying function in a module-level
+      ``WeakKeyDictionary``, so every further instance of the same class
+      reuses it instead of re-resolving hints and rebuilding the model. Each
+      entry still receives its own ``hints`` dict. Only a built model or a
+      genuine "no parameter hints" result is cached: when hint resolution
+      fails (e.g. an unresolved forward reference) nothing is cached, so a
+      later router retries once the name exists.
 - ``wrap_handler(route, entry, call_next)``:
     * calls ``get_model()`` to check if validation is disabled or no model exists.
     * if ``get_model()`` returns None, returns ``call_next`` (passthrough).
@@ -55,7 +64,9 @@ Registers itself globally as ``"pydantic"`` during module import via
 from __future__ import annotations
 
 import inspect
+from types import MethodType
 from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, get_type_hints
+from weakref import WeakKeyDictionary
 
 try:
     from pydantic import ValidationError, create_model
@@ -70,6 +81,12 @@ from smartroute.plugins._base_plugin import BasePlugin, MethodEntry
 if TYPE_CHECKING:
     from smartroute.core import Router
 
+_ValidationSpec = Optional[Tuple[Any, Dict[str, Any], inspect.Signature]]
+_SPEC_CACHE: "WeakKeyDictionary[Callable, _ValidationSpec]" = WeakKeyDictionary()
+# Returned by _build_spec when hints cannot be resolved yet (never cached);
+# compared by identity only, typed as a spec so no Any leaks out
+_UNRESOLVED: _ValidationSpec = (None, {}, inspect.Signature())
+
 
 class PydanticPlugin(BasePlugin):
     """Validate handler inputs with Pydantic using type hints."""
@@ -88,16 +105,38 @@ class PydanticPlugin(BasePlugin):
         pass  # Storage is handled by the wrapper
 
     def on_decore(self, route: "Router", func: Callable, entry: MethodEntry) -> None:
+        # Bound methods of the same function share one spec (and one model)
+        cache_key = func.__func__ if type(func) is MethodType else None
+        if cache_key is not None and cache_key in _SPEC_CACHE:
+            spec = _SPEC_CACHE[cache_key]
+        else:
+            spec = self._build_spec(func)
+            if spec is _UNRESOLVED:
+                # e.g. a forward reference not defined yet: retry on the next router
+                return
+            if cache_key is not None:
+                _SPEC_CACHE[cache_key] = spec
+        if spec is None:
+            return
+        validation_model, hints, sig = spec
+        entry.metadata["pydantic"] = {
+            "model": validation_model,
+            "hints": dict(hints),
+            "signature": sig,
+        }
+
+    @staticmethod
+    def _build_spec(func: Callable) -> _ValidationSpec:
         try:
             hints = get_type_hints(func)
         except Exception:
             # No hints resolvable, no model created
-            return
+            return _UNRESOLVED
 
         hints.pop("return", None)
         if not hints:
             # No parameter hints, no model needed
-            return
+            return None
 
         sig = inspect.signature(func)
         fields = {}
@@ -114,12 +153,7 @@ class PydanticPlugin(BasePlugin):
                 fields[param_name] = (hint, param.default)
 
         validation_model = create_model(f"{func.__name__}_Model", **fields)  # type: ignore
-
-        entry.metadata["pydantic"] = {
-            "model": validation_model,
-            "hints": hints,
-            "signature": sig,
-        }
+        return validation_model, hints, sig
 
     def wrap_handler(self, route: "Router", entry: MethodEntry, call_next: Callable):
         """Validate annotated parameters with the cached Pydantic model before calling."""
@@ -134,7 +168,7 @@ class PydanticPlugin(BasePlugin):
 
         def wrapper(*args, **kwargs):
             # Check disabled config at runtime (not at wrap time)
-            cfg = self.configuration(entry.name)
+            cfg = self._config_view(entry.name)
             if cfg.get("disabled"):
                 return call_next(*args, **kwargs)
 
@@ -159,7 +193,7 @@ class PydanticPlugin(BasePlugin):
 
     def get_model(self, entry: MethodEntry) -> Optional[Tuple[str, Any]]:
         """Return the Pydantic model for this handler if not disabled."""
-        cfg = self.configuration(entry.name)
+        cfg = self._config_view(entry.name)
         if cfg.get("disabled"):
             return None
 
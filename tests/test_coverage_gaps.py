@@ -28,6 +28,45 @@ def test_members_with_plugin_returns_extra_info():
     assert "plugins" in entry_info
 
 
+def test_members_omits_plugins_when_none_contribute():
+    """Plugins with no config and no metadata leave the entry untouched."""
+
+    class Svc(RoutedClass):
+        def __init__(self):
+            self.api = Router(self, name="api").plug("pydantic")
+
+        @route("api")
+        def handler(self, text):
+            return text
+
+    svc = Svc()
+    svc.api._plugin_info.pop("pydantic", None)
+    assert "plugins" not in svc.api.members()["entries"]["handler"]
+
+
+def test_members_skips_plugin_description_without_plugins():
+    """A plugin-free Router returns before touching plugins or their store."""
+
+    class NoIteration(list):
+        def __iter__(self):
+            raise AssertionError("plugins iterated on a plugin-free router")
+
+    class Svc(RoutedClass):
+        def __init__(self):
+            self.api = Router(self, name="api")
+
+        @route("api")
+        def handler(self, text):
+            return text
+
+    svc = Svc()
+    entry_info = svc.api.members()["entries"]["handler"]
+    assert "plugins" not in entry_info
+    assert svc.api._plugin_info == {}
+    svc.api._plugins = NoIteration()
+    assert svc.api._describe_entry_extra(svc.api._entries["handler"], entry_info) == {}
+
+
 # --- router.py:130 - _PluginSpec.clone ---
 
 
@@ -110,3 +110,34 @@ def test_pydantic_plugin_config_merge_base_and_handler():
         svc.api.get("handler_a")(123, "oops")
 
     assert svc.api.get("handler_b")(123, "oops") == "123:oops"
+
+
+def test_pydantic_model_shared_across_instances():
+    first = ValidateService()
+    second = ValidateService()
+    meta_a = first.api._entries["concat"].metadata["pydantic"]
+    meta_b = second.api._entries["concat"].metadata["pydantic"]
+    assert meta_a["model"] is meta_b["model"]
+    assert meta_a["hints"] == meta_b["hints"] == {"text": str, "number": int}
+    assert meta_a["hints"] is not meta_b["hints"]
+    with pytest.raises(ValidationError):
+        second.api.get("concat")(123, "oops")
+
+
+def test_pydantic_unresolved_hints_retried_on_later_instances(monkeypatch):
+    class Deferred(RoutedClass):
+        def __init__(self):
+            self.api = Router(self, name="api").plug("pydantic")
+
+        @route("api")
+        def scale(self, number: "LaterNumber") -> int:  # noqa: F821
+            return number * 2
+
+    early = Deferred()
+    assert "pydantic" not in early.api._entries["scale"].metadata
+    monkeypatch.setitem(globals(), "LaterNumber", int)
+    late = Deferred()
+    assert late.api._entries["scale"].metadata["pydantic"]["hints"] == {"number": int}
+    assert late.api.get("scale")("4") == 8
+    with pytest.raises(ValidationError):
+        late.api.get("scale")("x")
@@ -1,6 +1,7 @@
 import pytest
 
 from smartroute import RoutedClass, Router, route
+from smartroute.core.base_router import BaseRouter
 from smartroute.plugins import pydantic as pyd_mod
 from smartroute.plugins._base_plugin import BasePlugin, MethodEntry  # Not public API
 
@@ -54,6 +55,29 @@ def test_plugin_constructor_flags():
     assert svc.api.get_config("simple", "foo")["enabled"] is False
 
 
+def test_plugin_configuration_copies_and_view_shares_store():
+    class Host(RoutedClass):
+        def __init__(self):
+            self.api = Router(self, name="api").plug("simple", threshold=3)
+
+    svc = Host()
+    plugin = svc.api._plugins_by_name["simple"]
+    base_store = svc.api._plugin_info["simple"]["_all_"]["config"]
+
+    # configuration() always returns a private copy
+    cfg = plugin.configuration("foo")
+    cfg["threshold"] = 99
+    assert plugin.configuration("foo")["threshold"] == 3
+
+    # _config_view() reuses the store when there is no per-handler override
+    assert plugin._config_view("foo") is base_store
+    plugin.configure(_target="foo", threshold=7)
+    view = plugin._config_view("foo")
+    assert view is not base_store
+    assert view["threshold"] == 7
+    assert base_store["threshold"] == 3
+
+
 def ensure_plugin(plugin_cls: type) -> None:
     if plugin_cls.plugin_code not in Router.available_plugins():
         Router.register_plugin(plugin_cls)
@@ -71,6 +95,22 @@ def test_plugin_configuration_missing_bucket():
     plugin = svc.api._plugins_by_name["simple"]
     svc.api._plugin_info.pop(plugin.name, None)
     assert plugin.configuration() == {}
+    # Writing recreates the missing plugin bucket
+    plugin.configure(threshold=2)
+    assert plugin.configuration()["threshold"] == 2
+
+
+def test_runtime_setters_recreate_missing_locals():
+    class Host(RoutedClass):
+        def __init__(self):
+            self.api = Router(self, name="api").plug("simple")
+
+    svc = Host()
+    svc.api._plugin_info["simple"]["foo"] = {"config": {}}
+    svc.api.set_runtime_data("foo", "simple", "hits", 1)
+    svc.api.set_plugin_enabled("foo", "simple", False)
+    assert svc.api._plugin_info["simple"]["foo"]["locals"] == {"hits": 1, "enabled": False}
+    assert svc.api.get_runtime_data("foo", "simple", "hits") == 1
 
 
 def test_plugin_bucket_guards_and_base_autofill():
@@ -183,6 +223,27 @@ def test_router_detects_handler_name_collision():
     with pytest.raises(ValueError):
         DuplicateService()
 
+    class Manual(RoutedClass):
+        def __init__(self):
+            self.api = Router(self, name="api", auto_discover=False)
+
+        def dup(self):
+            return "manual"
+
+        @route("api")
+        def marked(self):
+            return "marked"
+
+    svc = Manual()
+    svc.api.add_entry(svc.dup, name="marked")
+    with pytest.raises(ValueError):
+        svc.api.add_entry(svc.dup, name="marked")
+    # Marker batches are validated before anything is registered
+    with pytest.raises(ValueError):
+        svc.api.add_entry("*")
+    assert svc.api.entries() == ("marked",)
+    assert svc.api.call("marked") == "manual"
+
 
 def test_iter_plugins_and_missing_attribute():
     class Service(RoutedClass):
@@ -675,3 +736,88 @@ def test_routed_configure_question_lists_tree():
     assert "api" in info
     assert info["api"]["plugins"]
     assert info["api"]["routers"] == {}
+
+
+def test_handlers_unwrapped_without_middleware():
+    class Plain(RoutedClass):
+        def __init__(self):
+            self.api = BaseRouter(self, name="api")
+            self.routed = Router(self, name="routed")
+
+        @route("api")
+        @route("routed")
+        def ping(self):
+            return "pong"
+
+    svc = Plain()
+    assert svc.api._handlers["ping"] == svc.ping
+    svc.api._rebuild_handlers()
+    assert svc.api.call("ping") == "pong"
+    assert svc.routed._handlers["ping"] == svc.ping
+    svc.routed.plug("simple")
+    assert svc.routed._handlers["ping"] != svc.ping
+    assert svc.routed.call("ping") == "pong"
+
+
+def test_entry_hooks_only_called_when_overridden():
+    calls = []
+
+    class Hooked(BaseRouter):
+        __slots__ = ()
+
+        def _after_entry_registered(self, entry):
+            calls.append(entry.name)
+
+        def _describe_entry_extra(self, entry, base_description):
+            return {"extra": True}
+
+    class Plain(RoutedClass):
+        def __init__(self):
+            self.api = BaseRouter(self, name="api")
+            self.hooked = Hooked(self, name="hooked")
+
+        @route("api")
+        @route("hooked")
+        def ping(self):
+            return "pong"
+
+    svc = Plain()
+    assert not BaseRouter._overrides_after_entry
+    assert not BaseRouter._overrides_describe_entry
+    assert Router._overrides_after_entry and Router._overrides_describe_entry
+    assert calls == ["ping"]
+    assert "extra" not in svc.api.members()["entries"]["ping"]
+    assert svc.hooked.members()["entries"]["ping"]["extra"] is True
+
+
+def test_wrap_handler_override_alone_enables_wrapping():
+    class WrappingBase(BaseRouter):
+        __slots__ = ()
+
+        def _wrap_handler(self, entry, call_next):
+            return lambda *a, **kw: ("wrapped", call_next(*a, **kw))
+
+    class WrappingRouter(Router):
+        __slots__ = ()
+
+        def _wrap_handler(self, entry, call_next):
+            inner = super()._wrap_handler(entry, call_next)
+            return lambda *a, **kw: ("routed", inner(*a, **kw))
+
+    class Svc(RoutedClass):
+        def __init__(self):
+            self.api = WrappingBase(self, name="api")
+            self.routed = WrappingRouter(self, name="routed")
+
+        @route("api")
+        @route("routed")
+        def ping(self):
+            return "pong"
+
+    svc = Svc()
+    assert svc.api.call("ping") == ("wrapped", "pong")
+    assert svc.routed.call("ping") == ("routed", "pong")
+    svc.api._rebuild_handlers()
+    assert svc.api.call("ping") == ("wrapped", "pong")
+    svc.routed.plug("simple")
+    assert svc.routed.call("ping") == ("routed", "pong")
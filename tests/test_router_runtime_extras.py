@@ -1,5 +1,8 @@
 """Additional coverage tests for runtime-only Router behavior."""
 
+import gc
+import weakref
+
 import pytest
 
 from smartroute import RoutedClass, Router, route
@@ -109,6 +112,7 @@ def test_add_entry_variants_and_wildcards():
 
     svc.api.add_entry("first, second", replace=True)
     before = set(svc.api.entries())
+    assert svc.api.entries() is svc.api.entries()
     assert svc.api.add_entry("   ") is svc.api
     assert set(svc.api.entries()) == before
 
@@ -116,11 +120,83 @@ def test_add_entry_variants_and_wildcards():
         svc.api.add_entry(123)
 
     svc.api.add_entry("*", metadata={"source": "wild"})
+    assert "auto" in svc.api.entries()
     entry = svc.api._entries["auto"]
     assert entry.metadata["marker"] == "yes"
     assert entry.metadata["source"] == "wild"
 
 
+def test_add_entry_list_copies_metadata_per_entry():
+    svc = ManualService()
+    shared_meta = {"tag": "x"}
+    svc.api.add_entry(["first", "second"], metadata=shared_meta)
+    first_meta = svc.api._entries["first"].metadata
+    assert first_meta == shared_meta
+    assert first_meta is not shared_meta
+    assert first_meta is not svc.api._entries["second"].metadata
+
+
+def test_add_entry_comma_string_skips_empty_tokens():
+    svc = ManualService()
+    svc.api.add_entry("first, , second,")
+    assert set(svc.api.entries()) == {"first", "second"}
+
+
+def test_add_entry_comma_and_list_forward_plugin_options():
+    svc = ManualService()
+    svc.api.plug("logging")
+    svc.api.add_entry("first, *", logging_before=False, tag="t")
+    svc.api.add_entry(["second"], logging_after=False)
+    info = svc.api._plugin_info["logging"]
+    assert info["first"]["config"] == {"before": False}
+    assert info["auto"]["config"] == {"before": False}
+    assert info["second"]["config"] == {"after": False}
+    assert svc.api._entries["first"].metadata["tag"] == "t"
+    assert svc.api._entries["auto"].metadata["marker"] == "yes"
+
+
+def test_add_entry_keeps_non_plugin_underscore_options_as_metadata():
+    svc = ManualService()
+    svc.api.plug("logging")
+    svc.api.add_entry(["second"], logging_after=False, logging_=1, _logging=2, ghost_key=3)
+    assert svc.api._plugin_info["logging"]["second"]["config"] == {"after": False}
+    second_meta = svc.api._entries["second"].metadata
+    assert {k: second_meta[k] for k in ("logging_", "_logging", "ghost_key")} == {
+        "logging_": 1,
+        "_logging": 2,
+        "ghost_key": 3,
+    }
+
+
+def test_plugin_info_is_a_fresh_copy_of_the_store():
+    svc = ManualService()
+    svc.api.plug("logging")
+    first = svc.api._get_plugin_info()
+    assert first == svc.api._get_plugin_info()
+    first["logging"]["_all_"]["config"].clear()
+    assert svc.api._plugin_info["logging"]["_all_"]["config"]
+    svc.api.logging.configure(before=False)
+    assert svc.api._get_plugin_info()["logging"]["_all_"]["config"]["before"] is False
+
+
+def test_prepare_filter_args_drops_only_none_and_false():
+    svc = ManualService()
+    assert svc.api._prepare_filter_args() == {}
+    assert svc.api._prepare_filter_args(a=None, b=False, c=0, d="x") == {"c": 0, "d": "x"}
+
+
+def test_add_entry_fan_out_gives_each_entry_its_own_plugin_config():
+    svc = ManualService()
+    svc.api.add_entry(["first", "second"], logging_before=False)
+    first_cfg = svc.api._entries["first"].metadata["plugin_config"]
+    second_cfg = svc.api._entries["second"].metadata["plugin_config"]
+    first_cfg["logging"]["before"] = True
+    assert second_cfg == {"logging": {"before": False}}
+    svc.api.add_entry("auto, first", logging_after=False, replace=True)
+    auto_cfg = svc.api._entries["auto"].metadata["plugin_config"]
+    assert auto_cfg is not svc.api._entries["first"].metadata["plugin_config"]
+
+
 def test_plugin_on_decore_runs_for_existing_entries():
     svc = ManualService()
     svc.api.plug("stamp_extra")
@@ -128,6 +204,18 @@ def test_plugin_on_decore_runs_for_existing_entries():
     assert svc.api._entries["alias_first"].metadata["stamped"] is True
 
 
+def test_plugin_on_decore_annotations_do_not_touch_caller_metadata():
+    svc = ManualService()
+    svc.api.plug("stamp_extra")
+    caller_meta = {"source": "caller"}
+    svc.api.add_entry(svc.first, name="alias_first", metadata=caller_meta)
+    svc.api.add_entry("second, *", metadata=caller_meta)
+    assert svc.api._entries["alias_first"].metadata["stamped"] is True
+    assert svc.api._entries["auto"].metadata["stamped"] is True
+    # Plugin annotations land on the entry copy, never on the caller's dict
+    assert caller_meta == {"source": "caller"}
+
+
 def test_iter_marked_methods_skip_other_router_markers():
     svc = DualRoutes()
     svc.one.add_entry("*")
@@ -135,6 +223,11 @@ def test_iter_marked_methods_skip_other_router_markers():
     assert "shared" in svc.one.entries()
     assert "two_alias" in svc.two.entries()
 
+    # Marker index is cached per class; payloads are copied per consumer
+    again = DualRoutes()
+    again.two.add_entry("*")
+    assert "two_alias" in again.two.entries()
+
 
 def test_iter_marked_methods_deduplicate_same_function():
     svc = DuplicateMarkers()
@@ -206,6 +299,18 @@ def test_iter_instance_attributes_skip_registry_and_slots():
     weird = WeirdSlots()
     assert list(inst.slot_router._iter_instance_attributes(weird)) == []
 
+    class SubSlotRouted(SlotRouted):
+        __slots__ = ("extra", "unset", "__hidden", "__dict__")
+
+        def __init__(self):
+            super().__init__()
+            self.extra = "value"
+
+    sub = SubSlotRouted()
+    keys = [name for name, _ in inst.slot_router._iter_instance_attributes(sub)]
+    assert keys[:2] == ["extra", "slot_router"]
+    assert "unset" not in keys and "__dict__" not in keys
+
     class RegistryHolder:
         pass
 
@@ -217,6 +322,81 @@ def test_iter_instance_attributes_skip_registry_and_slots():
     assert any(name == "extra" for name, _ in attrs)
 
 
+def test_attach_instance_finds_child_stored_in_slot():
+    class SlotParent(RoutedClass):
+        __slots__ = ("api", "child")
+
+        def __init__(self):
+            self.api = Router(self, name="api", auto_discover=False)
+            self.child = ManualService()
+
+    parent = SlotParent()
+    parent.api.attach_instance(parent.child, name="child")
+    assert parent.api._children["child"] is parent.child.api
+
+
+def test_slot_scan_cache_does_not_keep_class_alive():
+    class Slotted:
+        __slots__ = ("value",)
+
+    probe = ManualService()
+    obj = Slotted()
+    obj.value = 1
+    assert list(probe.api._iter_instance_attributes(obj)) == [("value", 1)]
+    ref = weakref.ref(Slotted)
+    del obj, Slotted
+    gc.collect()
+    assert ref() is None
+
+
+def test_marker_index_does_not_keep_class_alive():
+    class Base(RoutedClass):
+        def __init__(self):
+            self.api = Router(self, name="api")
+
+        @route("api")
+        def ping(self):
+            return "base"
+
+    class Child(Base):
+        @route("api")
+        def pong(self):
+            return ("child", super().ping())
+
+    assert Child().api.call("pong") == ("child", "base")
+    assert Base().api.call("ping") == "base"
+    ref = weakref.ref(Child)
+    del Child
+    gc.collect()
+    assert ref() is None
+
+
+def test_marker_index_invalidation_sees_late_routes():
+    class Svc(RoutedClass):
+        def __init__(self):
+            self.api = Router(self, name="api")
+
+        @route("api")
+        def a(self):
+            return "a"
+
+    class SubSvc(Svc):
+        pass
+
+    assert Svc().api.entries() == ("a",)
+    assert SubSvc().api.entries() == ("a",)
+
+    def b(self):
+        return "b"
+
+    Svc.b = route("api")(b)
+    # The scan is frozen after the first instance
+    assert Svc().api.entries() == ("a",)
+    Router._invalidate_marker_index(Svc)
+    assert Svc().api.entries() == ("a", "b")
+    assert SubSvc().api.entries() == ("a", "b")
+
+
 def test_router_members_include_metadata_tree():
     parent = ManualService()
     parent.api.add_entry(parent.first)
@@ -224,6 +404,26 @@ def test_router_members_include_metadata_tree():
     assert "entries" in info
 
 
+def test_members_doc_cached_and_refreshed_on_replace():
+    class Documented(RoutedClass):
+        def __init__(self):
+            self.api = Router(self, name="api", auto_discover=False)
+
+        def ping(self):
+            """Original   doc."""
+
+        def pong(self):
+            """Replacement doc."""
+
+    svc = Documented()
+    svc.api.add_entry(svc.ping, name="ping")
+    assert svc.api.members()["entries"]["ping"]["doc"] == "Original   doc."
+    assert svc.api._doc_cache["ping"] == "Original   doc."
+    svc.api.add_entry(svc.pong, name="ping", replace=True)
+    assert "ping" not in svc.api._doc_cache
+    assert svc.api.members()["entries"]["ping"]["doc"] == "Replacement doc."
+
+
 def test_configure_validates_inputs_and_targets():
     svc = LoggingService()
     with pytest.raises(ValueError):
@@ -5,6 +5,7 @@ import sys
 import pytest
 
 from smartroute import RoutedClass, Router, route
+from smartroute.core import base_router
 from smartroute.plugins._base_plugin import BasePlugin  # Not public API
 
 
@@ -156,6 +157,16 @@ def test_prefix_and_name_override():
     assert sub.routes.get("detail")(10) == "users:detail:10"
 
 
+def test_prefix_reassigned_after_init_is_honoured():
+    sub = SubService("users")
+    sub.routes.prefix = "handle"
+    sub.routes.add_entry(sub.handle_list, replace=True)
+    assert "_list" in sub.routes.entries()
+    sub.routes.prefix = ""
+    sub.routes.add_entry(sub.handle_detail, replace=True)
+    assert "handle_detail" in sub.routes.entries()
+
+
 def test_plugins_are_per_instance_and_accessible():
     svc = PluginService()
     assert svc.api.capture.calls == []
@@ -199,10 +210,15 @@ def test_get_with_smartasync(monkeypatch):
     fake_module = type(sys)("smartasync")
     fake_module.smartasync = fake_smartasync
     monkeypatch.setitem(sys.modules, "smartasync", fake_module)
+    monkeypatch.setattr(base_router, "_smartasync", None)
     svc = PluginService()
     handler = svc.api.get("do_work", use_smartasync=True)
     handler()
     assert calls == ["wrapped"]
+    # Imported once, then reused from the module-level reference
+    monkeypatch.delitem(sys.modules, "smartasync")
+    svc.api.get("do_work", use_smartasync=True)()
+    assert calls == ["wrapped", "wrapped"]
 
 
 def test_get_uses_init_default_handler():
@@ -225,6 +241,19 @@ def test_get_runtime_override_init_default_handler():
     assert handler() == "runtime"
 
 
+def test_get_kwargs_default_handler_wins_over_argument():
+    class DefaultService(RoutedClass):
+        def __init__(self):
+            self.api = Router(
+                self,
+                name="api",
+                get_default_handler=lambda: "argument",
+                get_kwargs={"default_handler": lambda: "kwargs"},
+            )
+
+    assert DefaultService().api.get("missing")() == "kwargs"
+
+
 def test_get_without_default_raises():
     svc = PluginService()
     with pytest.raises(NotImplementedError):
@@ -244,6 +273,7 @@ def test_get_uses_init_smartasync(monkeypatch):
     fake_module = type(sys)("smartasync")
     fake_module.smartasync = fake_smartasync
     monkeypatch.setitem(sys.modules, "smartasync", fake_module)
+    monkeypatch.setattr(base_router, "_smartasync", None)
 
     class AsyncService(RoutedClass):
         def __init__(self):
@@ -272,6 +302,7 @@ def test_get_can_disable_init_smartasync(monkeypatch):
     fake_module = type(sys)("smartasync")
     fake_module.smartasync = fake_smartasync
     monkeypatch.setitem(sys.modules, "smartasync", fake_module)
+    monkeypatch.setattr(base_router, "_smartasync", None)
 
     class AsyncService(RoutedClass):
         def __init__(self):
@@ -323,3 +354,107 @@ def test_dotted_path_and_members_with_attached_child():
     assert parent.api.get("child.ping")() == "pong"
     tree = parent.api.members()
     assert "child" in tree["routers"]
+
+
+class ScopeFilterPlugin(BasePlugin):
+    plugin_code = "scopefilter"
+    plugin_description = "Filters entries by their scopes metadata"
+
+    def allow_entry(self, router, entry, **filters):
+        scopes = filters.get("scopes")
+        if scopes is None:
+            return None
+        return entry.metadata.get("scopes") == scopes
+
+
+Router.register_plugin(ScopeFilterPlugin)
+
+
+def test_members_returns_fresh_trees():
+    class Child(RoutedClass):
+        def __init__(self):
+            self.api = Router(self, name="api", auto_discover=False).plug("logging")
+
+        def ping(self):
+            return "pong"
+
+    class Parent(RoutedClass):
+        def __init__(self):
+            self.api = Router(self, name="api")
+            self.child = Child()
+            self.api.attach_instance(self.child, name="child")
+
+        @route("api", scopes="public")
+        def root(self):
+            return "root"
+
+    parent = Parent()
+    tree = parent.api.members()
+    assert "routers" not in tree
+    parent.child.api.add_entry(parent.child.ping)
+
+    # Editing a result (e.g. before serialising) never leaks into later calls
+    tree = parent.api.members()
+    child_tree = tree["routers"]["child"]
+    child_tree.pop("router")
+    child_tree["plugin_info"]["logging"].clear()
+    child_tree["entries"]["ping"].pop("callable")
+    tree["entries"].clear()
+    again = parent.api.members()
+    assert again is not tree
+    assert "root" in again["entries"]
+    assert again["routers"]["child"]["router"] is parent.child.api
+    assert "_all_" in again["routers"]["child"]["plugin_info"]["logging"]
+    assert again["routers"]["child"]["entries"]["ping"]["callable"] == parent.child.ping
+    assert parent.child.api.members() is not again["routers"]["child"]
+
+    # Plugin config and runtime writes are visible
+    parent.child.api.logging.configure(before=False)
+    child_tree = parent.child.api.members()
+    assert child_tree["plugin_info"]["logging"]["_all_"]["config"]["before"] is False
+    parent.child.api.set_plugin_enabled("ping", "logging", False)
+    child_tree = parent.child.api.members()
+    assert child_tree["plugin_info"]["logging"]["ping"]["locals"]["enabled"] is False
+
+    # In-place metadata edits are seen by filters
+    parent.api.plug("scopefilter")
+    assert "root" in parent.api.members(scopes="public").get("entries", {})
+    parent.api._entries["root"].metadata["scopes"] = "internal"
+    assert "root" not in parent.api.members(scopes="public").get("entries", {})
+
+    # Detach is reflected
+    parent.api.detach_instance(parent.child)
+    assert "routers" not in parent.api.members()
+
+
+def test_dotted_get_follows_children_changes():
+    class Child(RoutedClass):
+        def __init__(self, label):
+            self.label = label
+            self.api = Router(self, name="api", auto_discover=False)
+            self.api.add_entry(self.ping)
+
+        def ping(self):
+            return self.label
+
+    class Parent(RoutedClass):
+        def __init__(self):
+            self.api = Router(self, name="api")
+
+    parent = Parent()
+    parent.first = Child("first")
+    parent.second = Child("second")
+    parent.api.attach_instance(parent.first, name="child")
+    assert parent.api.call("child.ping") == "first"
+    assert parent.api.call("child.ping") == "first"
+
+    parent.api.detach_instance(parent.first)
+    with pytest.raises(KeyError):
+        parent.api.get("child.ping")
+    parent.api.attach_instance(parent.second, name="child")
+    assert parent.api.call("child.ping") == "second"
+
+    # Direct edits of _children are seen by the next lookup
+    parent.api._children.pop("child")
+    with pytest.raises(KeyError):
+        parent.api.get("child.ping")